@@ -2,9 +2,24 @@
 pdfplucker - a powerful wrapper for the Docling library
 """
 # __init__.py
-from pdfplucker.processor import process_batch, process_pdf, create_converter, process_with_timeout, _update_metrics
-from pdfplucker.utils import format_results, setup_logging, get_safe_executor
-from pdfplucker.core import pdfplucker
+# Exports are loaded on first access (PEP 562), so importing the package
+# (e.g. for `pdfplucker --help`) doesn't pull docling and torch in
+import importlib
+
+_LAZY_EXPORTS = {
+    "setup_logging": "pdfplucker.utils",
+    "get_safe_executor": "pdfplucker.utils",
+    "format_results": "pdfplucker.utils",
+    "process_with_timeout": "pdfplucker.processor",
+    "_update_metrics": "pdfplucker.processor",
+    "process_batch": "pdfplucker.processor",
+    "process_pdf": "pdfplucker.processor",
+    "create_converter": "pdfplucker.processor",
+    "get_converter": "pdfplucker.processor",
+    "clear_converter_cache": "pdfplucker.processor",
+    "create_converters": "pdfplucker.processor",
+    "pdfplucker": "pdfplucker.core",
+}
 
 __all__ = [
     "setup_logging",
@@ -14,6 +29,20 @@ __all__ = [
     "process_batch",
     "process_pdf",
     "create_converter",
+    "get_converter",
+    "clear_converter_cache",
+    "create_converters",
     "format_results",   
     "pdfplucker",
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
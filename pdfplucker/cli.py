@@ -1,17 +1,22 @@
 # CLI.py
 import os
 import sys
-import argparse
 import time
-import torch
 import psutil
+from functools import lru_cache
 from pathlib import Path
-from pdfplucker.core import pdfplucker
+from typing import TYPE_CHECKING
+from pdfplucker.colors import BLUE, GREEN, YELLOW, RED, RESET
+from pdfplucker.profiler import rss_bytes, MB
+
+if TYPE_CHECKING:
+    import argparse
 
 def create_parser():
     '''
     Create the argument parser for the command line interface.
     '''
+    import argparse
 
     parser = argparse.ArgumentParser(
         description='Docling wrapper for extracting PDF information.',
@@ -83,9 +88,97 @@ def create_parser():
         help='Amount of files to process'
     )
 
+    parser.add_argument(
+        '--image-format',
+        choices=['png', 'jpeg', 'webp'],
+        default='png',
+        help='Format of the extracted images (jpeg and webp are smaller and faster to encode, but lossy)'
+    )
+
+    parser.add_argument(
+        '--skip-images',
+        action='store_true',
+        help="Don't render or save the pictures found in the PDFs (captions and classes are kept)"
+    )
+
+    parser.add_argument(
+        '--images-scale',
+        type=float,
+        default=1.0,
+        help='Resolution scale for the extracted pictures (2.0 renders 4 times the pixels)'
+    )
+
+    parser.add_argument(
+        '--fast-text',
+        action='store_true',
+        help='Skip OCR and table structure for PDFs that already have a text layer (tables come out unstructured)'
+    )
+
+    parser.add_argument(
+        '--skip-formulas',
+        action='store_true',
+        help="Don't run the formula model (equations are not converted to LaTeX)"
+    )
+
+    parser.add_argument(
+        '--skip-classification',
+        action='store_true',
+        help="Don't run the picture classifier (pictures get no class)"
+    )
+
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Shortcut for --skip-formulas --skip-classification --skip-images (text, tables and captions only)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Sample memory and CPU usage (workers included) and print the peaks at the end'
+    )
+
     return parser
 
-def validate_args(args: argparse.Namespace):
+def _gpu_available() -> bool:
+    '''Checks for an NVIDIA GPU through NVML, without initializing a CUDA context'''
+    try:
+        from pynvml import nvmlInit, nvmlDeviceGetCount, nvmlShutdown
+    except ImportError:
+        # NVML bindings not installed (pip install pdfplucker[gpu]), ask torch instead
+        import torch
+        return torch.cuda.is_available()
+
+    try:
+        nvmlInit()
+    except Exception:
+        # No NVIDIA driver, or a GPU that can't be used with CUDA
+        return False
+    try:
+        return nvmlDeviceGetCount() > 0
+    finally:
+        nvmlShutdown()
+
+@lru_cache(maxsize=None)
+def _physical_cpus() -> int:
+    '''Physical core count, looked up once per process'''
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 4
+
+def _memory_percent() -> float:
+    '''Percentage of system memory in use'''
+    if sys.platform.startswith('linux'):
+        try:
+            meminfo = {}
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    key, value = line.split(':', 1)
+                    meminfo[key] = int(value.split()[0])
+            return 100 * (meminfo['MemTotal'] - meminfo['MemAvailable']) / meminfo['MemTotal']
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            pass
+    return psutil.virtual_memory().percent
+
+def validate_args(args: 'argparse.Namespace'):
     '''This function check the many arguments needs'''
 
     # Checking for the source path
@@ -95,8 +188,13 @@ def validate_args(args: argparse.Namespace):
     
     # Checking if source, as a directory, contains PDFs
     if Path(source_path).is_dir():
-        pdf_files = list(source_path.glob("*.pdf"))
-        if not pdf_files:
+        # Stops at the first PDF instead of listing the whole directory
+        with os.scandir(source_path) as entries:
+            has_pdf = any(
+                entry.name.lower().endswith('.pdf') and entry.is_file()
+                for entry in entries
+            )
+        if not has_pdf:
             return False, f"No PDF files found: {args.source}"
         
     # Checkging if source, as a file, is a PDF
@@ -108,11 +206,17 @@ def validate_args(args: argparse.Namespace):
         return False, f"Number of workers must be greater than 0: {args.workers}"
     
     # Optimize amount of processors
-    cpu_count = psutil.cpu_count(logical=False) or 4
+    cpu_count = _physical_cpus()
     if args.workers > cpu_count + 1:
-        print(f"\033[33mWarning: Number of workers is greater than available CPU cores ({cpu_count}). Using {args.workers} instead.\033[0m")
-        print(f"\033[33mConsider using {cpu_count} workers instead.\033[0m")
+        print(f"{YELLOW}Warning: Number of workers is greater than available CPU cores ({cpu_count}). Using {args.workers} instead.{RESET}")
+        print(f"{YELLOW}Consider using {cpu_count} workers instead.{RESET}")
     
+    if args.images_scale <= 0:
+        return False, f"Images scale must be greater than 0: {args.images_scale}"
+
+    if args.fast_text and args.force_ocr:
+        return False, "--fast-text and --force-ocr cannot be used at the same time."
+
     # Check timeout
     if args.timeout < 1:
         return False, f"Timeout must be greater than 0: {args.timeout}"
@@ -123,7 +227,7 @@ def validate_args(args: argparse.Namespace):
         return False, f"Output path is not a directory: {args.output}"
     if not output_path.exists():
         output_path.mkdir(parents=True, exist_ok=True)
-        print(f"\033[33mWarning: Output path doesn't exist, creating at source directory: {args.output}\033[0m")
+        print(f"{YELLOW}Warning: Output path doesn't exist, creating at source directory: {args.output}{RESET}")
 
     # Check if images path is a directory, and create if necessary
     if args.images:
@@ -132,7 +236,7 @@ def validate_args(args: argparse.Namespace):
             return False, f"Images path is not a directory: {args.images}"
         if not images_path.exists():
             images_path.mkdir(parents=True, exist_ok=True)
-            print(f"\033[32mImages path created: {args.images}\033[0m")
+            print(f"{GREEN}Images path created: {args.images}{RESET}")
     
     # Check if the user wants to use folder separation and images path at the same time
     if args.folder_separation and args.images:
@@ -140,7 +244,7 @@ def validate_args(args: argparse.Namespace):
     
     # Check, if not using folder separation, if image_path is set, and create if necessary
     if not args.folder_separation and not args.images:
-        print("\033[33mWarning: Images path not set. Using default path.\033[0m")
+        print(f"{YELLOW}Warning: Images path not set. Using default path.{RESET}")
         images_path = output_path / 'images'
         if not images_path.exists():
             images_path.mkdir(parents=True, exist_ok=True)
@@ -148,92 +252,113 @@ def validate_args(args: argparse.Namespace):
     if not args.folder_separation and args.images:
         if not images_path.exists():
             images_path.mkdir(parents=True, exist_ok=True)
-            print(f"\033[33mImages path created: {args.images}\033[0m")
+            print(f"{YELLOW}Images path created: {args.images}{RESET}")
 
     if args.device.upper() == 'CUDA':
         try:
-            if not torch.cuda.is_available():
+            # CPU and AUTO need no check (docling resolves AUTO itself)
+            if not _gpu_available():
                 return False, "CUDA is not available on this device. Please use CPU or AUTO."
         except Exception as e:
-            print(f"\033[33mWarning: Error checking CUDA availability: {e}\033[0m")
+            print(f"{YELLOW}Warning: Error checking CUDA availability: {e}{RESET}")
             args.device = 'CPU'
-            print("\033[33mFalling back to CPU processing\033[0m")
+            print(f"{YELLOW}Falling back to CPU processing{RESET}")
 
-    mem = psutil.virtual_memory()
-    if mem.percent > 80:
-        print("\033[33mWarning: Memory usage is high. Consider closing other applications.\033[0m")
-        print
+    if _memory_percent() > 80:
+        print(f"{YELLOW}Warning: Memory usage is high. Consider closing other applications.{RESET}")
     
     return True, None
 
-def process_single_file(args: argparse.Namespace):
+def process_single_file(args: 'argparse.Namespace'):
     '''Process a single PDF file and save the results'''
-    source_path = args.source
-    output_path = args.output
+    # Arguments are already validated and normalized, so skip the pdfplucker() wrapper
+    from pdfplucker.core import print_banner
+    from pdfplucker.processor import create_converters, process_pdf
+
+    source_path = Path(args.source)
+    output_path = Path(args.output)
+    device = args.device.upper()
 
     if args.folder_separation:
-        # Get the filename without extension to use as folder name
-        base_filename = os.path.splitext(os.path.basename(source_path))[0]
-        pdf_folder = os.path.join(output_path, base_filename)
-        images_path = os.path.join(pdf_folder, "images")
-        
-        # Create both parent directory and images directory
-        os.makedirs(pdf_folder, exist_ok=True)
-        os.makedirs(images_path, exist_ok=True)
-        print(f"\033[32mCreated folder: {pdf_folder}\033[0m")
+        # process_pdf creates <output>/<pdf name>/images itself
+        pdf_folder = output_path / source_path.stem
+        images_path = pdf_folder / "images"
+        print(f"{GREEN}Output folder: {pdf_folder}{RESET}")
     else:
-        images_path = args.images if args.images else os.path.join(output_path, "images")
-        os.makedirs(images_path, exist_ok=True)
+        images_path = Path(args.images) if args.images else output_path / "images"
+
+    print_banner(
+        args.source, args.output, device, args.workers, args.force_ocr,
+        args.timeout, args.markdown, args.folder_separation, images_path, args.amount,
+    )
 
     start_time = time.time()
-    success = pdfplucker(
-        source=source_path,
-        output=output_path,
-        folder_separation=args.folder_separation,
-        images=images_path,
-        timeout=args.timeout,
-        workers=args.workers,
+    doc_converter, text_converter = create_converters(
+        device=device,
+        num_threads=args.workers,
         force_ocr=args.force_ocr,
-        device=args.device,
-        markdown=args.markdown,
+        generate_picture_images=not args.skip_images,
+        images_scale=args.images_scale,
+        fast_text=args.fast_text,
+        formula_enrichment=not args.skip_formulas,
+        picture_classification=not args.skip_classification,
+    )
+    success = process_pdf(
+        source_path,
+        output_path,
+        images_path,
+        doc_converter,
+        args.folder_separation,
+        args.markdown,
+        args.image_format,
+        text_converter,
     )
 
     elapsed_time = time.time() - start_time
     if success:
-        print(f"\033[32mProcessing completed successfully in {elapsed_time:.2f} seconds\033[0m")
+        print(f"{GREEN}Processing completed successfully in {elapsed_time:.2f} seconds{RESET}")
         print("=" * 50)
         print(f"Output path: {output_path}")
         print(f"Images path: {images_path}")
-
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024
-        print(f"Memory usage: {memory_mb:.2f} MB")
+        print(f"Memory usage: {rss_bytes() / MB:.2f} MB")
     else:
-        print(f"\033[31mProcessing failed\033[0m")
+        print(f"{RED}Processing failed{RESET}")
     return success
 
 def main():
     '''Main CLI function'''
-    parser = create_parser()
-
     if len(sys.argv) == 1:
-        print("\033[34mPdfPlucker CLI - Docling Wrapper\033[0m")
-        print("A tool for extracting information from PDF files.")
-        print("Use the `--help` flag to see available options.")
+        sys.stdout.write(
+            f"{BLUE}PdfPlucker CLI - Docling Wrapper{RESET}\n"
+            "A tool for extracting information from PDF files.\n"
+            "Use the `--help` flag to see available options.\n"
+        )
         sys.exit(0)
 
-    args = parser.parse_args()
-    # Format the arguments
-    for arg_name, arg_value in vars(args).items():
-        if isinstance(arg_value, str):
-            vars(args)[arg_name] = arg_value.replace('\\', '/') # For Windows compatibility
+    args = create_parser().parse_args()
+    if args.fast:
+        args.skip_formulas = args.skip_classification = args.skip_images = True
+
+    # Heavy imports (docling, torch) are deferred until there is work to do
+    from pdfplucker.core import pdfplucker
+    from pdfplucker.utils import setup_logging
+    setup_logging()
+    # Normalize the path arguments for Windows compatibility
+    for name in ('source', 'output', 'images'):
+        value = getattr(args, name)
+        if value:
+            setattr(args, name, value.replace('\\', '/'))
     # Validate the arguments
     valid_args, error = validate_args(args)
     if not valid_args:
-        print(f"\033[91mError: {error}\033[0m")
+        print(f"{RED}Error: {error}{RESET}")
         sys.exit(1)
 
+    profiler = None
+    if args.profile:
+        from pdfplucker.profiler import ResourceProfiler
+        profiler = ResourceProfiler().start()
+
     # Start the processing
     try:
         if Path(args.source).is_file():
@@ -252,34 +377,44 @@ def main():
                 device=args.device.upper(),
                 markdown=args.markdown,
                 amount=args.amount if args.amount > 0 else 0,
+                image_format=args.image_format,
+                extract_images=not args.skip_images,
+                images_scale=args.images_scale,
+                fast_text=args.fast_text,
+                formula_enrichment=not args.skip_formulas,
+                picture_classification=not args.skip_classification,
             )
 
         # Print the metrics
-        print("=" * 50)
-        print("\033[32mProcessing completed successfully\033[0m")
-        print(f"\033[32mMetrics in output path as final_metrics.json\033[0m")      
-        print("=" * 50)
-        print(f"Total amount of files: {metrics['total_docs']}")
-        print(f"Successfully processed: {metrics['processed_docs']}")
-        print(f"Failed processes: {metrics['failed_docs']}")
-        print(f"Success rate: {metrics['success_rate']}")
-        print(f"Total time elapsed: {metrics['elapsed_time']:.2f} seconds")
-        print("=" * 50)
-
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024
-        print(f"Memory usage: {memory_mb:.2f} MB")
-        print("=" * 50)
+        line = "=" * 50
+        sys.stdout.write(
+            f"{line}\n"
+            f"{GREEN}Processing completed successfully{RESET}\n"
+            f"{GREEN}Metrics in output path as final_metrics.json{RESET}\n"
+            f"{line}\n"
+            f"Total amount of files: {metrics['total_docs']}\n"
+            f"Successfully processed: {metrics['processed_docs']}\n"
+            f"Failed processes: {metrics['failed_docs']}\n"
+            f"Success rate: {metrics['success_rate']}\n"
+            f"Total time elapsed: {metrics['elapsed_time']:.2f} seconds\n"
+            f"{line}\n"
+            f"Memory usage: {rss_bytes() / MB:.2f} MB\n"
+            f"{line}\n"
+        )
+        sys.stdout.flush()
     
     except KeyboardInterrupt:
-        print("\033[31mProcess interrupted by user\033[0m")
+        print(f"{RED}Process interrupted by user{RESET}")
         sys.exit(1)
     except Exception as e:
-        print(f"\033[31mAn error occurred: {e}\033[0m")
+        print(f"{RED}An error occurred: {e}{RESET}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if profiler:
+            profiler.stop()
+            print(profiler.summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,10 @@
+# colors.py
+# Kept free of heavy imports so both the CLI and the library layer can use it
+import os
+import sys
+
+# ANSI colours, left empty when the output is not a terminal or NO_COLOR is set
+if sys.stdout and sys.stdout.isatty() and 'NO_COLOR' not in os.environ:
+    BLUE, GREEN, YELLOW, RED, RESET = '\033[34m', '\033[32m', '\033[33m', '\033[31m', '\033[0m'
+else:
+    BLUE = GREEN = YELLOW = RED = RESET = ''
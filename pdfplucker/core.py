@@ -1,13 +1,32 @@
 # pdfplucker/core.py
-import multiprocessing
+import os
+import sys
 from pathlib import Path
-from pdfplucker.processor import process_batch, process_pdf, create_converter
+from pdfplucker.colors import BLUE, RESET
+from pdfplucker.processor import process_batch, process_pdf, create_converters
+from pdfplucker.utils import setup_logging, IMAGE_FORMATS
 
-try:
-    multiprocessing.set_start_method("spawn", force=True)
-except RuntimeError:
-    # If the start method is already set, we can ignore the error
-    pass
+def print_banner(source, output, device, workers, force_ocr, timeout, markdown, folder_separation, images, amount) -> None:
+    """Prints the run settings in a single write"""
+    line = "=" * 50
+    sys.stdout.write(
+        f"{line}\n"
+        f"{BLUE}PdfPlucker CLI - Docling Wrapper{RESET}\n"
+        f"{line}\n"
+        f"Source path: {source}\n"
+        f"Output path: {output}\n"
+        f"Device type: {device}\n"
+        f"Number of workers: {workers}\n"
+        f"Force OCR: {'yes' if force_ocr else 'no'}\n"
+        f"Timeout: {timeout} seconds\n"
+        f"Save markdown: {'yes' if markdown else 'no'}\n"
+        f"Folder separation: {'yes' if folder_separation else 'no'}\n"
+        f"Images path: {images if images else 'not used'}\n"
+        f"Amount of files to process: {amount if amount > 0 else 'all'}\n"
+        f"{line}\n"
+        "Starting...\n"
+    )
+    sys.stdout.flush()
 
 def pdfplucker(
     source: str | Path,
@@ -20,6 +39,12 @@ def pdfplucker(
     device: str = "AUTO",
     markdown: bool = False,
     amount: int = 0,
+    image_format: str = "png",
+    extract_images: bool = True,
+    images_scale: float = 1.0,
+    fast_text: bool = False,
+    formula_enrichment: bool = True,
+    picture_classification: bool = True,
 ):
     """
     Process PDF files and extract information.
@@ -46,57 +71,71 @@ def pdfplucker(
         Export the document in an additional markdown file
     amount : int, default=0
         Amount of files to process (0 for all)
+    image_format : str, default="png"
+        Format of the extracted images ("png", "jpeg" or "webp")
+    extract_images : bool, default=True
+        Render and save the pictures found in the documents
+    images_scale : float, default=1.0
+        Resolution scale used when rendering pictures
+    fast_text : bool, default=False
+        Skip OCR and table structure for PDFs that already have a text layer
+    formula_enrichment : bool, default=True
+        Run the formula model to extract equations as LaTeX
+    picture_classification : bool, default=True
+        Run the picture classifier to label each extracted picture
     
     Returns:
     --------
     dict or bool
         If processing a batch, returns metrics dictionary
         If processing a single file, returns success status (bool)
+
+    Raises:
+    -------
+    ValueError
+        If fast_text and force_ocr are both set, or image_format is not supported
     """
     
-    source_path = Path(source)
-    output_path = Path(output)
-    image_path = Path(images) if images else None
+    if fast_text and force_ocr:
+        # fast_text would send born-digital PDFs past OCR, silently ignoring force_ocr
+        raise ValueError("fast_text and force_ocr cannot be used at the same time")
+    if image_format not in IMAGE_FORMATS:
+        # Checked before any conversion, format_results would only fail after it
+        raise ValueError(f"Unsupported image_format {image_format!r}, expected one of {', '.join(IMAGE_FORMATS)}")
+
+    setup_logging()
+
+    # Normalize paths once, for Windows compatibility
+    source_path = Path(os.fspath(source).replace('\\', '/'))
+    output_path = Path(os.fspath(output).replace('\\', '/'))
+    image_path = Path(os.fspath(images).replace('\\', '/')) if images else None
 
     device = device.upper()
 
-    print("=" * 50)
-    print("\033[34mPdfPlucker CLI - Docling Wrapper\033[0m")
-    print("=" * 50)
-    print(f"Source path: {source}")
-    print(f"Output path: {output}")
-    print(f"Device type: {device}")
-    print(f"Number of workers: {workers}")
-    print(f"Force OCR: {'yes' if force_ocr else 'no'}")
-    print(f"Timeout: {timeout} seconds")
-    print(f"Save markdown: {'yes' if markdown else 'no'}")
-    print(f"Folder separation: {'yes' if folder_separation else 'no'}")
-    print(f"Images path: {images if images else 'not used'}")
-    print(f"Amount of files to process: {amount if amount > 0 else 'all'}")
-    print("=" * 50)
-    print("Starting...")
+    print_banner(source, output, device, workers, force_ocr, timeout, markdown, folder_separation, images, amount)
 
-    # Normalize paths for Windows compatibility
-    source_path = Path(str(source_path).replace('\\', '/'))
-    output_path = Path(str(output_path).replace('\\', '/'))
-    if image_path:
-        image_path = Path(str(image_path).replace('\\', '/'))
-    
     if source_path.is_file():
-        # Process single PDF
-        doc_converter = create_converter(
-            device=device.upper(),
+        # Process single PDF, reusing the converter (and its loaded models)
+        # of an earlier call with the same options
+        doc_converter, text_converter = create_converters(
+            device=device,
             num_threads=workers,
             force_ocr=force_ocr,
+            generate_picture_images=extract_images,
+            images_scale=images_scale,
+            fast_text=fast_text,
+            formula_enrichment=formula_enrichment,
+            picture_classification=picture_classification,
+            cached=True,
         )
-        
+
         if folder_separation:
             images_path = output_path / source_path.stem / "images"
         else:
             images_path = image_path or output_path / "images"
-        
+
         images_path.mkdir(parents=True, exist_ok=True)
-        
+
         sucess = process_pdf(
             source_path,
             output_path,
@@ -104,6 +143,8 @@ def pdfplucker(
             doc_converter,
             folder_separation,
             markdown,
+            image_format,
+            text_converter,
         )
         return sucess
     else:
@@ -115,8 +156,14 @@ def pdfplucker(
             separate_folders=folder_separation,
             max_workers=workers,
             timeout=timeout,
-            device=device.upper(),
+            device=device,
             markdown=markdown,
             force_ocr=force_ocr,
             amount=amount if amount > 0 else None,
+            image_format=image_format,
+            generate_picture_images=extract_images,
+            images_scale=images_scale,
+            fast_text=fast_text,
+            formula_enrichment=formula_enrichment,
+            picture_classification=picture_classification,
         )
\ No newline at end of file
@@ -1,13 +1,18 @@
 # Version 1.1.0
 import os
 import gc
+import sys
 import json
 import fitz
 import time
-import multiprocessing  # Changed back to multiprocessing
+import queue
+import ctypes
+from collections import OrderedDict
+from multiprocessing.connection import Connection
 from pathlib import Path
-from concurrent.futures import as_completed, TimeoutError
-from pdfplucker.utils import format_results, get_safe_executor, logger, Data
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pdfplucker.profiler import rss_bytes
+from pdfplucker.utils import format_results, write_json, IMAGE_FORMATS, setup_logging, setup_worker_logging, forward_worker_logs, logger, Data, MP_CONTEXT
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import ConversionResult
@@ -21,6 +26,9 @@ from docling.datamodel.pipeline_options import (
 )
 # from docling.datamodel.pipeline_options import granite_picture_description -> For a future trial
 
+# Every error of a batch is one line of this file inside temp_dir
+_ERRORS_FILE = "errors.jsonl"
+
 def update_error_log(
     filename: str,
     error: str,
@@ -48,23 +56,27 @@ def update_error_log(
         else:
             temp_dir = os.path.join(output_dir, "temp_errors")
     
-    # Create temp directory if it doesn't exist
-    os.makedirs(temp_dir, exist_ok=True)
-    
+    errors_file = os.path.join(temp_dir, _ERRORS_FILE)
+
     if not final:
-        # Create a safe filename for the temp file
-        safe_filename = Path(filename).stem
-        error_file = os.path.join(temp_dir, f"error_{safe_filename}_{int(time.time())}.json")
-        
-        # Write error information to temp file
+        # Write error information as one line of the shared log
         error_data = {
             "file": filename,
             "error": error,
             "timestamp": time.time()
         }
-        
-        with open(error_file, 'w', encoding='utf-8') as f:
-            json.dump(error_data, f, ensure_ascii=False, indent=2)
+        line = (json.dumps(error_data, ensure_ascii=False) + "\n").encode('utf-8')
+
+        # Append mode and a single write per line, so lines from
+        # different worker processes don't interleave
+        try:
+            f = open(errors_file, 'ab')
+        except FileNotFoundError:
+            # First error of the batch: create the temp directory only now
+            os.makedirs(temp_dir, exist_ok=True)
+            f = open(errors_file, 'ab')
+        with f:
+            f.write(line)
             
     else:
         # Final mode - consolidate all errors and update metrics
@@ -75,29 +87,33 @@ def update_error_log(
         if 'fails' not in metrics:
             metrics['fails'] = []
         
-        # Get all error files
-        error_files = [f for f in os.listdir(temp_dir) if f.startswith("error_")]
-        
-        # Read all error files and collect data
+        # Read the error log once, line by line
         all_errors = []
-        for error_file in error_files:
-            try:
-                with open(os.path.join(temp_dir, error_file), 'r', encoding='utf-8') as f:
-                    error_data = json.load(f)
+        try:
+            # Binary mode, so a line cut inside a multi-byte character fails
+            # in json.loads (as a ValueError) instead of in the file iterator
+            with open(errors_file, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        error_data = json.loads(line)
+                    except ValueError as e:
+                        # e.g. a line cut short by a worker killed mid-write
+                        logger.warning(f"Skipping line {line_number} of {errors_file}: {e}")
+                        continue
                     all_errors.append({
                         'file': error_data.get('file', 'unknown'),
                         'error': error_data.get('error', 'Unknown error')
                     })
-            except Exception as e:
-                print(f"Error reading error file {error_file}: {e}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error reading error file {errors_file}: {e}")
         
         # Add all errors to metrics (without overwriting existing ones)
-        metrics['fails'] = metrics['fails'] + all_errors
-        
-        # Update failed_docs count to match the total number of unique failed files
-        # Create a set of unique filenames that failed
-        unique_failed_files = set(error['file'] for error in metrics['fails'])
-        metrics['failed_docs'] = len(unique_failed_files)
+        metrics['fails'].extend(all_errors)
+
+        # failed_docs is kept by process_batch as each PDF finishes, so it
+        # is not recounted from the log, which can hold several entries per file
         
         if 'success_rate' in metrics:
             # Recalculate success rate
@@ -109,16 +125,18 @@ def update_error_log(
 
         # Write final metrics file
         metrics_file = os.path.join(output_dir, 'final_metrics.json')
-        with open(metrics_file, 'w', encoding='utf-8') as f:
-            json.dump(metrics, f, ensure_ascii=False, indent=2)
+        write_json(metrics_file, metrics, default=json_serializable, atomic=True)
 
-        # delete temp directory and all files inside it
+        # delete temp directory and the error log inside it
         try:
-            for error_file in error_files:
-                os.remove(os.path.join(temp_dir, error_file))
+            if os.path.exists(errors_file):
+                os.remove(errors_file)
             os.rmdir(temp_dir)
+        except FileNotFoundError:
+            # No error was logged, so the directory was never created
+            pass
         except Exception as e:
-            print(f"Error deleting temp directory {temp_dir}: {e}")
+            logger.warning(f"Error deleting temp directory {temp_dir}: {e}")
 
 def json_serializable(obj):
     """Função auxiliar para tornar objetos personalizados serializáveis em JSON."""
@@ -127,16 +145,42 @@ def json_serializable(obj):
     else:
         return str(obj)
 
-def create_converter(device : str = 'CPU', num_threads : int = 4, ocr_lang: list = ['es', 'pt'], force_ocr: bool = False) -> DocumentConverter:
+# Accepted device names; anything else falls back to AUTO
+_DEVICE_MAP = {
+    'CUDA': AcceleratorDevice.CUDA,
+    'CPU': AcceleratorDevice.CPU,
+    'AUTO': AcceleratorDevice.AUTO,
+}
+
+# Pages per model call on CUDA when no batch_size is given
+_CUDA_BATCH_SIZE = 10
+_BATCH_SIZE_OPTIONS = ('ocr_batch_size', 'layout_batch_size', 'table_batch_size')
+
+def create_converter(
+        device : str = 'CPU',
+        num_threads : int = 4,
+        ocr_lang: list = ['es', 'pt'],
+        force_ocr: bool = False,
+        generate_picture_images: bool = True,
+        images_scale: float = 1.0,
+        text_only: bool = False,
+        batch_size: int | None = None,
+        formula_enrichment: bool = True,
+        picture_classification: bool = True,
+) -> DocumentConverter:
     ''' Create a DocumentConverter object with the pipeline options configured''' 
     pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = True
-    pipeline_options.do_table_structure = True
+    # text_only is meant for born-digital PDFs: no OCR and no TableFormer,
+    # the two most expensive stages of the pipeline
+    pipeline_options.do_ocr = not text_only
+    pipeline_options.do_table_structure = not text_only
     pipeline_options.table_structure_options.do_cell_matching = True 
     pipeline_options.ocr_options.lang = ocr_lang
-    pipeline_options.generate_picture_images = True
-    pipeline_options.do_picture_classification = True
-    pipeline_options.do_formula_enrichment = True
+    # Rendering pictures is a large share of the pipeline time, skip it when the files aren't wanted
+    pipeline_options.generate_picture_images = generate_picture_images
+    # Each of these loads one more model and runs it on every page
+    pipeline_options.do_picture_classification = picture_classification
+    pipeline_options.do_formula_enrichment = formula_enrichment
     #pipeline_options.do_picture_description = True
     #pipeline_options.picture_description_options = (
     #    smolvlm_picture_description
@@ -145,7 +189,7 @@ def create_converter(device : str = 'CPU', num_threads : int = 4, ocr_lang: list
     #    "Descreva a imagem em 3 frases. Seja sucinto e preciso."
     #)
 
-    pipeline_options.images_scale = 1
+    pipeline_options.images_scale = images_scale
     
     if force_ocr:
         # Rapid OCR or Easy OCr
@@ -153,8 +197,17 @@ def create_converter(device : str = 'CPU', num_threads : int = 4, ocr_lang: list
         pipeline_options.ocr_options = ocr_options
     
     # Device acceleration
-    device_type = AcceleratorDevice.CUDA if device.upper() == 'CUDA' else AcceleratorDevice.CPU if device.upper() == 'CPU' else AcceleratorDevice.AUTO if device.upper() == 'AUTO' else AcceleratorDevice.AUTO
+    device_type = _DEVICE_MAP.get(device.upper(), AcceleratorDevice.AUTO)
     pipeline_options.accelerator_options = AcceleratorOptions(num_threads=num_threads, device=device_type)
+
+    # Feed the GPU several pages per model call; on CPU docling's defaults are kept
+    if batch_size is None and device_type == AcceleratorDevice.CUDA:
+        batch_size = _CUDA_BATCH_SIZE
+    if batch_size is not None:
+        # Only docling versions with the threaded pipeline have these knobs
+        for option in _BATCH_SIZE_OPTIONS:
+            if hasattr(pipeline_options, option):
+                setattr(pipeline_options, option, batch_size)
     
     converter = DocumentConverter(
         format_options={
@@ -164,7 +217,62 @@ def create_converter(device : str = 'CPU', num_threads : int = 4, ocr_lang: list
 
     return converter
 
-def _worker(source, output, image_path, doc_converter, separate_folders, markdown, queue: multiprocessing.Queue):
+# Converters already built in this process, keyed by their options, most
+# recently used last. Each one holds a full model set (hundreds of MB, or GPU
+# memory), so only the pair a fast_text call needs is kept
+_CONVERTER_CACHE_SIZE = 2
+_converter_cache: OrderedDict[tuple, DocumentConverter] = OrderedDict()
+
+def get_converter(**options) -> DocumentConverter:
+    ''' Same as create_converter, but reuses a converter built earlier with the same options '''
+    key = tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in options.items()
+    ))
+    converter = _converter_cache.get(key)
+    if converter is None:
+        converter = _converter_cache[key] = create_converter(**options)
+        while len(_converter_cache) > _CONVERTER_CACHE_SIZE:
+            _converter_cache.popitem(last=False)
+    else:
+        _converter_cache.move_to_end(key)
+    return converter
+
+def clear_converter_cache() -> None:
+    ''' Drops the converters kept by get_converter, releasing their models '''
+    _converter_cache.clear()
+    gc.collect()
+
+def create_converters(
+        device: str = 'CPU',
+        num_threads: int = 4,
+        force_ocr: bool = False,
+        generate_picture_images: bool = True,
+        images_scale: float = 1.0,
+        fast_text: bool = False,
+        formula_enrichment: bool = True,
+        picture_classification: bool = True,
+        cached: bool = False,
+) -> tuple[DocumentConverter, DocumentConverter | None]:
+    ''' Builds the main converter and, with fast_text, the text-only one used for born-digital PDFs '''
+    build = get_converter if cached else create_converter
+    options = dict(
+        device=device,
+        num_threads=num_threads,
+        generate_picture_images=generate_picture_images,
+        images_scale=images_scale,
+        formula_enrichment=formula_enrichment,
+        picture_classification=picture_classification,
+    )
+    doc_converter = build(force_ocr=force_ocr, **options)
+    text_converter = build(text_only=True, **options) if fast_text else None
+    return doc_converter, text_converter
+
+def _worker(source, output, image_path, doc_converter, separate_folders, markdown, result_conn: Connection, log_conn=None):
+    if log_conn is not None:
+        setup_worker_logging(log_conn)
+    else:
+        setup_logging()
     try:
         result = process_pdf(
             source,
@@ -174,11 +282,12 @@ def _worker(source, output, image_path, doc_converter, separate_folders, markdow
             separate_folders,
             markdown,
         )
-        queue.put(result)
     except Exception as e:
         logger.error(f"Non treated error at _worker function: {e}")
         update_error_log(str(source), f"Non treated error at _worker: {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
-        queue.put(False)
+        result = False
+    result_conn.send(result)
+    result_conn.close()
 
 def process_with_timeout(
     source: Path,
@@ -192,43 +301,60 @@ def process_with_timeout(
     """ Process a single PDF with safety timeout """
     """ Returns True if successful, False otherwise """
 
-    if multiprocessing.get_start_method() != 'spawn':
-        multiprocessing.set_start_method('spawn', force=True)
+    # A one-way pipe carries the single result; no feeder thread, and poll()
+    # waits for it directly instead of racing Queue.empty() after join()
+    result_recv, result_send = MP_CONTEXT.Pipe(duplex=False)
 
-    queue = multiprocessing.Queue()
-    
     filename = os.path.basename(source)
+    temp_err_dir = os.path.join(output, "temp_errors")
     logger.info(f"Starting processing for '{filename}'")
 
-    process = multiprocessing.Process(
+    log_recv, log_send = MP_CONTEXT.Pipe(duplex=False)
+    process = MP_CONTEXT.Process(
         target=_worker,
-        args=(source, output, image_path, doc_converter, separate_folders, markdown, queue) 
+        args=(source, output, image_path, doc_converter, separate_folders, markdown, result_send, log_send)
     )
-    
+
     start_time = time.time()
     process.start()
-    process.join(timeout)
+    result_send.close()
+    log_send.close()
+    forward_worker_logs(log_recv)
 
-    if process.is_alive():
-        logger.error(f"Timeout after {timeout}s! Killing process for '{filename}'")
-        update_error_log(str(source), f"Timeout reached for '{filename}'", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
-        process.terminate()
-        process.join()
-        return False
-    
     try:
-        if not queue.empty():
-            result = queue.get()
-            time_elapsed = time.time() - start_time
-            if result:
-                logger.info(f"Successfully processed '{filename}' in {time_elapsed:.2f}s")
-                return True
-            else:
-                return False
-    except Exception as e:
-        logger.error(f"Error retrieving result: {e}")
-        update_error_log(str(source), f"Error retrieving results: {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        if not result_recv.poll(timeout):
+            logger.error(f"Timeout after {timeout}s! Killing process for '{filename}'")
+            update_error_log(str(source), f"Timeout reached for '{filename}'", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
+            process.terminate()
+            return False
+        result = result_recv.recv()
+    except (EOFError, OSError) as e:
+        logger.error(f"Worker process died while processing '{filename}': {e}")
+        update_error_log(str(source), f"Worker process died: {e}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
+    finally:
+        process.join()
+        result_recv.close()
+
+    if result:
+        time_elapsed = time.time() - start_time
+        logger.info(f"Successfully processed '{filename}' in {time_elapsed:.2f}s")
+        return True
+    return False
+
+# Mean characters of embedded text per sampled page for a PDF to count as born-digital
+_MIN_PAGE_CHARS = 50
+
+def needs_ocr(doc: fitz.Document, sample_pages: int = 5) -> bool:
+    """Checks a few pages spread through the document for a usable text layer"""
+    num_pages = doc.page_count
+    if num_pages == 0:
+        return True
+    step = max(num_pages // sample_pages, 1)
+    sampled = range(0, num_pages, step)[:sample_pages]
+    # The mean, so one cover or full-page figure doesn't send a digital PDF to OCR
+    total_chars = sum(len(doc[page_number].get_text("text").strip()) for page_number in sampled)
+    return total_chars < _MIN_PAGE_CHARS * len(sampled)
 
 def process_pdf(
         source: Path,
@@ -237,24 +363,30 @@ def process_pdf(
         doc_converter: DocumentConverter,
         separate_folders: bool | None = False,
         markdown: bool = False,
+        image_format: str = 'png',
+        text_converter: DocumentConverter | None = None,
 ) -> bool:
     """Function to process a single PDF file utilizing Docling"""
+    """With a text_converter, PDFs that already have a text layer skip OCR and table structure"""
 
-    conv = None
-    filename = Path(os.path.basename(source))
-    base_filename = Path(os.path.splitext(filename)[0])
+    source = Path(source)
+    output = Path(output)
+    filename = source.name
+    base_filename = source.stem
+    temp_err_dir = os.path.join(output, "temp_errors")
     logger.debug(f"Starting PDF processing for {filename}")
 
     try:
         if separate_folders:
-            specific_folder = Path(os.path.join(output, base_filename))
-            result = Path(os.path.join(specific_folder, f"{base_filename}.json"))
-            image_folder = Path(os.path.join(specific_folder, "images"))
-            os.makedirs(specific_folder, exist_ok=True)
-            os.makedirs(image_folder, exist_ok=True)
+            specific_folder = output / base_filename
+            result = specific_folder / f"{base_filename}.json"
+            image_folder = specific_folder / "images"
         else:
-            result = Path(os.path.join(output, f"{base_filename}.json"))
+            result = output / f"{base_filename}.json"
             image_folder = Path(image_path)
+        # Checked on every call: the folders may have been removed since the last one
+        os.makedirs(image_folder, exist_ok=True)
+        os.makedirs(result.parent, exist_ok=True)
     
         data: Data = {
             "metadata": {},
@@ -265,10 +397,11 @@ def process_pdf(
         }
 
         # Use PyMuPDF (fitz) for extracting metadata - lightweight operation
-        with fitz.open(source) as doc:
+        # filetype skips format detection; page_count is read once and reused
+        with fitz.open(source, filetype="pdf") as doc:
             raw_metadata = doc.metadata
             # Check number of pages for large documents
-            num_pages = len(doc)
+            num_pages = doc.page_count
             if num_pages > 100:
                 logger.warning(f"Large document detected: {filename} has {num_pages} pages")
 
@@ -278,66 +411,276 @@ def process_pdf(
                 "creationDate": raw_metadata.get('creationDate') or None,
                 "modDate": raw_metadata.get("modDate") or None,
                 "filename": filename,
-                "pageAmount": len(doc) or None
+                "pageAmount": num_pages or None
             }) 
 
+            if text_converter is not None and not needs_ocr(doc):
+                logger.debug(f"Text layer found in {filename}, using the text-only converter")
+                doc_converter = text_converter
+
         conv: ConversionResult = doc_converter.convert(str(source)) # use str instead of Path
 
-        success = format_results(conv, data, base_filename, image_folder)
+        success = format_results(conv, data, base_filename, image_folder, image_format)
 
         if not success:
             logger.error(f"Error while formatting results from '{filename}'")
-            update_error_log(str(source), f"Error while formatting results from '{filename}'", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+            update_error_log(str(source), f"Error while formatting results from '{filename}'", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
             return False
 
         # Save Markdown if asked
         if markdown:
+            md_filename = result.with_suffix(".md")
+            # Written next to the target and moved into place, so an
+            # interrupted export never leaves a truncated .md behind
+            md_temp = md_filename.with_name(md_filename.name + ".tmp")
             try:
-                if separate_folders:
-                    md_filename = Path(os.path.join(specific_folder, f"{base_filename}.md"))
-                    conv.document.save_as_markdown(md_filename, image_mode=ImageRefMode.EMBEDDED)
-                else:
-                    md_filename = Path(os.path.join(output, f"{base_filename}.md"))
-                    conv.document.save_as_markdown(md_filename, image_mode=ImageRefMode.EMBEDDED)
+                conv.document.save_as_markdown(md_temp, image_mode=ImageRefMode.EMBEDDED)
+                os.replace(md_temp, md_filename)
             except Exception as md_error:
                 logger.error(f"Error saving markdown: {md_error}")
-                update_error_log(str(source), f"Failed to export markdown: {md_error}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+                try:
+                    os.remove(md_temp)
+                except OSError:
+                    pass
+                update_error_log(str(source), f"Failed to export markdown: {md_error}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
                 return False
 
-        with open(result, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False, default=json_serializable)
+        write_json(result, data, default=json_serializable)
 
         return True
 
     except MemoryError:
         logger.error(f"Out of memory while converting '{filename}'")
-        update_error_log(str(source), f"Out of memory while converting '{filename}'", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        update_error_log(str(source), f"Out of memory while converting '{filename}'", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
     except (fitz.FileDataError, fitz.EmptyFileError) as e:
         logger.error(f"Failed to process '{filename}': {e}")
-        update_error_log(str(source), f"Failed to process '{filename}': {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        update_error_log(str(source), f"Failed to process '{filename}': {e}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
     except IOError as e:      
         logger.error(f"I/O error while processing '{filename}': {e}")
-        update_error_log(str(source), f"I/O error while processing '{filename}': {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        update_error_log(str(source), f"I/O error while processing '{filename}': {e}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
     except ConversionError as e:
         logger.error(f"Conversion error for '{filename}': {e}")
-        update_error_log(str(source), f"Conversion error for '{filename}': {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        update_error_log(str(source), f"Conversion error for '{filename}': {e}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
     except Exception as e:    
         import traceback
         logger.error(f"Error processing '{filename}': {str(e)}\n{traceback.format_exc()}")
-        update_error_log(str(source), f"Error processing '{filename}': {str(e)}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        update_error_log(str(source), f"Error processing '{filename}': {str(e)}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
         return False
 
-    finally:
-        gc.collect()  # Aggressive garbage collection
+def _load_malloc_trim():
+    """ glibc's malloc_trim, which hands freed heap pages back to the OS; None elsewhere """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return ctypes.CDLL('libc.so.6').malloc_trim
+    except (OSError, AttributeError):
+        # e.g. musl
+        return None
+
+def _converter_worker_main(conn, log_conn, device: str, num_threads: int, force_ocr: bool, generate_picture_images: bool = True, images_scale: float = 1.0, fast_text: bool = False, formula_enrichment: bool = True, picture_classification: bool = True) -> None:
+    """ Entry point of a ConverterWorker process """
+    """ Builds the converter once and serves PDFs from the pipe until told to stop """
+
+    # Records go to the parent, which owns the log files and the console
+    setup_worker_logging(log_conn)
+    # Resolved here rather than at import, which the CLI and forkserver also pay
+    malloc_trim = _load_malloc_trim()
+    doc_converter, text_converter = create_converters(
+        device=device,
+        num_threads=num_threads,
+        force_ocr=force_ocr,
+        generate_picture_images=generate_picture_images,
+        images_scale=images_scale,
+        fast_text=fast_text,
+        formula_enrichment=formula_enrichment,
+        picture_classification=picture_classification,
+    )
+    try:
+        # Load the models now instead of on the first PDF
+        doc_converter.initialize_pipeline(InputFormat.PDF)
+        if text_converter is not None:
+            text_converter.initialize_pipeline(InputFormat.PDF)
+    except Exception as e:
+        logger.warning(f"Could not preload the conversion models: {e}")
+    # Tells the parent the models are loaded, so its timeout only covers PDFs
+    conn.send(True)
+
+    while True:
         try:
-            del conv
-            del data
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        source, output, image_path, separate_folders, markdown, image_format = job
+        try:
+            result = process_pdf(source, output, image_path, doc_converter, separate_folders, markdown, image_format, text_converter)
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error(f"Non treated error at worker process: {e}")
+            update_error_log(str(source), f"Non treated error at worker process: {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+            result = False
+        conn.send(result)
+
+        # The worker lives for the whole batch; without a trim its RSS
+        # stays at the peak of the largest PDF it has converted
+        if malloc_trim is not None:
+            malloc_trim(0)
+
+    conn.close()
+
+class ConverterWorker:
+    """ Persistent process that keeps a DocumentConverter (and its models) loaded between PDFs """
+    """ A PDF that exceeds the timeout kills the process, which is restarted for the next one """
+
+    def __init__(self, device: str = 'AUTO', num_threads: int = 4, force_ocr: bool = False, generate_picture_images: bool = True, images_scale: float = 1.0, fast_text: bool = False, formula_enrichment: bool = True, picture_classification: bool = True):
+        self._args = (device, num_threads, force_ocr, generate_picture_images, images_scale, fast_text, formula_enrichment, picture_classification)
+        self._process = None
+        self._conn = None
+        self._log_thread = None
+        self._ready = False
+
+    def start(self, wait: bool = True) -> None:
+        """ Launches the worker process, by default waiting until its models are loaded """
+        parent_conn, child_conn = MP_CONTEXT.Pipe()
+        log_recv, log_send = MP_CONTEXT.Pipe(duplex=False)
+        self._process = MP_CONTEXT.Process(
+            target=_converter_worker_main,
+            args=(child_conn, log_send, *self._args),
+        )
+        self._process.start()
+        child_conn.close()
+        log_send.close()
+        self._conn = parent_conn
+        self._log_thread = forward_worker_logs(log_recv)
+        self._ready = False
+        if wait:
+            self.wait_ready()
+
+    def wait_ready(self) -> None:
+        """ Blocks until the worker has loaded its models, killing it if it dies meanwhile """
+        if self._ready or self._process is None:
+            return
+        try:
+            self._conn.recv()
+        except (EOFError, OSError) as e:
+            logger.error(f"Worker process died while loading the models: {e}")
+            self.kill()
+            return
+        self._ready = True
+
+    def stop(self) -> None:
+        """ Asks the worker to finish, killing it if it doesn't """
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join(10)
+        self.kill()
+
+    def kill(self) -> None:
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._conn.close()
+        # The pipe hits EOF once the process is gone; let the last records through
+        self._log_thread.join(1)
+        self._process = None
+        self._conn = None
+        self._log_thread = None
+        self._ready = False
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return process.pid if process is not None else None
+
+    def process(
+        self,
+        source: Path,
+        output: Path,
+        image_path: Path | None,
+        separate_folders: bool = False,
+        timeout: int = 600,
+        markdown: bool = False,
+        image_format: str = 'png',
+    ) -> bool:
+        """ Process a single PDF in the worker with safety timeout """
+        """ Returns True if successful, False otherwise """
+
+        filename = os.path.basename(source)
+        temp_err_dir = os.path.join(output, "temp_errors")
+
+        if self._process is None or not self._process.is_alive():
+            self.kill()
+            self.start()
+        # Model loading happens before the clock starts, not against this PDF
+        self.wait_ready()
+        if self._process is None:
+            update_error_log(str(source), "Worker process died while loading the models", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
+            return False
+
+        logger.info(f"Starting processing for '{filename}'")
+
+        start_time = time.time()
+        try:
+            self._conn.send((source, output, image_path, separate_folders, markdown, image_format))
+            if not self._conn.poll(timeout):
+                logger.error(f"Timeout after {timeout}s! Killing process for '{filename}'")
+                update_error_log(str(source), f"Timeout reached for '{filename}'", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
+                self.kill()
+                return False
+            result = self._conn.recv()
+        except (EOFError, OSError) as e:
+            logger.error(f"Worker process died while processing '{filename}': {e}")
+            update_error_log(str(source), f"Worker process died: {e}", final=False, temp_dir=temp_err_dir, metrics=None, output_dir=None)
+            self.kill()
+            return False
+
+        if result:
+            time_elapsed = time.time() - start_time
+            logger.info(f"Successfully processed '{filename}' in {time_elapsed:.2f}s")
+            return True
+        return False
+
+def _process_on_worker(workers: queue.Queue, source: Path, output: Path, *args) -> bool:
+    """ Borrows an idle ConverterWorker for a single PDF """
+    """ Any error is logged against the PDF here, so the future only ever carries a bool """
+    worker = workers.get()
+    try:
+        return worker.process(source, output, *args)
+    except Exception as e:
+        logger.error(f"Processing error for '{os.path.basename(str(source))}': {e}")
+        update_error_log(str(source), f"Processing error in worker pool: {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+        return False
+    finally:
+        workers.put(worker)
+
+# Files between two garbage collections in process_batch
+_GC_EVERY = 50
+
+# Files between two memory samples in process_batch
+_MEMORY_SAMPLE_EVERY = 10
+
+# Seconds between two writes of intermediate_metrics.json
+_METRICS_INTERVAL = 10
+
+def _batch_rss(workers: list[ConverterWorker]) -> int:
+    """ Resident memory of this process plus every live worker """
+    total = rss_bytes()
+    for worker in workers:
+        pid = worker.pid
+        if pid is not None:
+            total += rss_bytes(pid)
+    return total
 
 def process_batch(
     source: Path,
@@ -350,27 +693,37 @@ def process_batch(
     markdown: bool = False,
     force_ocr: bool = False,
     amount: int = None,
+    image_format: str = 'png',
+    generate_picture_images: bool = True,
+    images_scale: float = 1.0,
+    fast_text: bool = False,
+    formula_enrichment: bool = True,
+    picture_classification: bool = True,
 ) -> dict:
     """ Process a batch of PDFs at a time in parallel """
 
+    if image_format not in IMAGE_FORMATS:
+        # Otherwise every PDF would be fully converted before failing to format
+        raise ValueError(f"Unsupported image_format {image_format!r}, expected one of {', '.join(IMAGE_FORMATS)}")
+
     if not separate_folders and image_path is None:
         image_path = Path(f"{output}/images")
+    temp_err_dir = os.path.join(output, "temp_errors")
     
     # Create output directories
     os.makedirs(output, exist_ok=True)
     if not separate_folders:
         os.makedirs(image_path, exist_ok=True)
     
-    # create the doc_converter
-    doc_converter = create_converter(device=device, num_threads=max_workers, force_ocr=force_ocr)
-
     pdf_files = []
 
     if source.is_dir():
-        for file in os.listdir(source):
-            if file.lower().endswith('.pdf'):
-                file_path = Path(os.path.join(source, file))
-                pdf_files.append(file_path)
+        # DirEntry caches the file type, so no extra stat per entry
+        with os.scandir(source) as entries:
+            pdf_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
     pdf_files = pdf_files[:amount] if amount and amount > 0 else pdf_files
 
     total = len(pdf_files)
@@ -387,57 +740,100 @@ def process_batch(
         'memory_peak': 0,
     }
 
-    # Switch back to ProcessPoolExecutor
-    with get_safe_executor(max_workers=max_workers) as executor:
-        futures = {}
-        for pdf_file in pdf_files:
-            future = executor.submit(
-                process_with_timeout,
+    if total == 0:
+        # Nothing to convert, so don't load any models
+        metrics['fails'] = []
+        _update_metrics(metrics, output, final=True)
+        return metrics
+
+    # Each worker process builds its converter once and keeps it for the
+    # whole batch; threads only dispatch PDFs and enforce the timeouts.
+    # A worker per PDF at most, since each one loads the full model set
+    num_workers = min(max_workers, total)
+    if MP_CONTEXT.get_start_method() == 'forkserver':
+        # Set here rather than at import, so merely importing pdfplucker
+        # doesn't replace the host application's preload list
+        MP_CONTEXT.set_forkserver_preload(['pdfplucker.processor'])
+    converter_workers = [
+        ConverterWorker(
+            device=device,
+            num_threads=max_workers,
+            force_ocr=force_ocr,
+            generate_picture_images=generate_picture_images,
+            images_scale=images_scale,
+            fast_text=fast_text,
+            formula_enrichment=formula_enrichment,
+            picture_classification=picture_classification,
+        )
+        for _ in range(num_workers)
+    ]
+    idle_workers = queue.Queue()
+    # All workers load their models at the same time, then the batch waits for them
+    for worker in converter_workers:
+        worker.start(wait=False)
+    for worker in converter_workers:
+        worker.wait_ready()
+        idle_workers.put(worker)
+
+    # Same for every job, so resolved once instead of per submission
+    job_image_path = image_path if image_path else None
+
+    last_metrics_write = time.monotonic()
+    memory_peak = 0
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        futures = [
+            executor.submit(
+                _process_on_worker,
+                idle_workers,
                 pdf_file,
                 output,
-                image_path if image_path else None,
-                doc_converter,
+                job_image_path,
                 separate_folders,
                 timeout,
                 markdown,
+                image_format,
             )
-            futures[future] = pdf_file
+            for pdf_file in pdf_files
+        ]
 
         for future in as_completed(futures):
-            pdf_file = futures[future]
             metrics['processed_docs'] += 1
-            
-            try:
-                success = future.result()
-                if not success:
-                    metrics['failed_docs'] += 1
-            except TimeoutError:
-                logger.error(f"Timeout reached for '{os.path.basename(str(pdf_file))}'")
-                metrics['failed_docs'] += 1
-                update_error_log(str(source), f"Timeout error in ProcessPoolExecutor", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
-            except Exception as e:
-                logger.error(f"Processing error for '{os.path.basename(str(pdf_file))}': {e}")
-                update_error_log(str(source), f"Processing error in ProcessPoolExecutor: {e}", final=False, temp_dir=os.path.join(output, "temp_errors"), metrics=None, output_dir=None)
+            if not future.result():
                 metrics['failed_docs'] += 1
-            gc.collect()
 
-            if metrics['processed_docs'] % 5 == 0:
-                # Save intermediate metrics every 5 files
+            # The models live in the worker processes; this loop only holds
+            # small per-file objects, so an occasional collection is enough
+            if metrics['processed_docs'] % _GC_EVERY == 0:
+                gc.collect()
+
+            if metrics['processed_docs'] % _MEMORY_SAMPLE_EVERY == 0:
+                memory_peak = max(memory_peak, _batch_rss(converter_workers))
+                metrics['memory_peak'] = f"{(memory_peak / (1024 * 1024)):.2f} MB"
+
+            now = time.monotonic()
+            if now - last_metrics_write >= _METRICS_INTERVAL:
+                # Save intermediate metrics at most every few seconds
                 _update_metrics(metrics, output)
+                last_metrics_write = now
 
-        # Check for memory peak
-        import psutil
-        process = psutil.Process(os.getpid())
-        memory_info = process.memory_info()
-        metrics['memory_peak'] = f"{(memory_info.rss / (1024 * 1024)):.2f} MB"
+        # Taken before the workers exit, while their models are still loaded
+        last_rss = _batch_rss(converter_workers)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for worker in converter_workers:
+            worker.stop()
+
+    # Memory peak over the samples, this process and its workers together
+    memory_peak = max(memory_peak, last_rss)
+    metrics['memory_peak'] = f"{(memory_peak / (1024 * 1024)):.2f} MB"
 
     # Finalize metrics
-    del doc_converter
     gc.collect()
     _update_metrics(metrics, output, final=True)
     logger.info(f"Processing concluded, sucess rate: {metrics['success_rate']:.2f}%, total time: {metrics['elapsed_time']:.1f}s")
 
-    update_error_log("final", "Processing complete", final=True, temp_dir=os.path.join(output, "temp_errors"), metrics=metrics, output_dir=output)
+    update_error_log("final", "Processing complete", final=True, temp_dir=temp_err_dir, metrics=metrics, output_dir=output)
 
     return metrics
 
@@ -450,6 +846,12 @@ def _update_metrics(metrics: dict, output_dir: str, final: bool = False) -> None
         metrics['success_rate'] = ((processed - metrics['failed_docs']) / processed) * 100
     
     filename = 'final_metrics.json' if final else 'intermediate_metrics.json'
-    with open(os.path.join(output_dir, filename), 'w') as f:
-        json.dump(metrics, f, indent=2, ensure_ascii=False, default=json_serializable)
+    try:
+        write_json(os.path.join(output_dir, filename), metrics, default=json_serializable, atomic=True)
+    except OSError as e:
+        if final:
+            raise
+        # Métricas intermediárias são só acompanhamento, uma falha não interrompe o lote
+        logger.warning(f"Could not update {filename}: {e}")
+        return
     logger.info(f"Metrics updated: {filename}")
\ No newline at end of file
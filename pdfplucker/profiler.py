@@ -0,0 +1,120 @@
+# pdfplucker/profiler.py
+import os
+import sys
+import threading
+import psutil
+
+MB = 1024 * 1024
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if sys.platform.startswith('linux') else None
+
+def rss_bytes(pid: int | None = None) -> int:
+    '''Resident memory of a process (this one by default), 0 if it is gone'''
+    if sys.platform.startswith('linux'):
+        # One small read instead of psutil's several /proc files
+        try:
+            with open(f"/proc/{pid or 'self'}/statm") as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            return 0
+    try:
+        return (psutil.Process(pid) if pid else psutil.Process()).memory_info().rss
+    except psutil.Error:
+        return 0
+
+def _kernel_peaks() -> tuple[int, int] | None:
+    '''Kernel-tracked peak RSS and VMS of the current process (Linux only)'''
+    if not sys.platform.startswith('linux'):
+        return None
+    peaks = {}
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(('VmHWM:', 'VmPeak:')):
+                    key, value = line.split(':', 1)
+                    peaks[key] = int(value.split()[0]) * 1024
+    except (OSError, ValueError):
+        return None
+    if len(peaks) != 2:
+        return None
+    return peaks['VmHWM'], peaks['VmPeak']
+
+class ResourceProfiler:
+    '''Samples memory and CPU usage of this process and its workers in a background thread'''
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_vms = 0
+        self._cpu_total = 0.0
+        self._samples = 0
+        self._process = psutil.Process()
+        # Kept between samples so cpu_percent() measures since the previous call
+        self._children: dict[int, psutil.Process] = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        try:
+            current = self._process.children(recursive=True)
+        except psutil.Error:
+            current = []
+        self._children = {child.pid: self._children.get(child.pid, child) for child in current}
+
+        rss = vms = 0
+        cpu = 0.0
+        for proc in (self._process, *self._children.values()):
+            try:
+                with proc.oneshot():
+                    mem = proc.memory_info()
+                    cpu += proc.cpu_percent(interval=None)
+            except psutil.Error:
+                continue
+            rss += mem.rss
+            vms += mem.vms
+
+        self.peak_rss = max(self.peak_rss, rss)
+        self.peak_vms = max(self.peak_vms, vms)
+        self._cpu_total += cpu
+        self._samples += 1
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def start(self) -> 'ResourceProfiler':
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name='pdfplucker-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> 'ResourceProfiler':
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def mean_cpu(self) -> float:
+        return self._cpu_total / self._samples if self._samples else 0.0
+
+    def summary(self) -> str:
+        '''Peak figures over the whole run, workers included'''
+        lines = [
+            f"Peak RSS: {self.peak_rss / MB:.2f} MB, "
+            f"Peak VMS: {self.peak_vms / MB:.2f} MB, "
+            f"Mean CPU%: {self.mean_cpu:.1f}"
+        ]
+        peaks = _kernel_peaks()
+        if peaks:
+            hwm, vm_peak = peaks
+            lines.append(f"Main process peak RSS: {hwm / MB:.2f} MB, peak VMS: {vm_peak / MB:.2f} MB")
+        return "\n".join(lines)
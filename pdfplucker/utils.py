@@ -1,5 +1,5 @@
 # utils.py
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 import multiprocessing
 from docling.datamodel.document import ConversionResult
 from docling_core.types.doc import (
@@ -8,10 +8,25 @@ from docling_core.types.doc import (
     TextItem,
     DocItemLabel,
 )
-from typing import TypedDict, List, Dict, Any
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import TypedDict, List, Dict, Any, Callable
+import atexit
+import io
+import json
 import logging
 import os
+import queue
+import sys
+import threading
 import traceback
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    # Optional fast JSON encoder (pip install pdfplucker[fast])
+    import orjson
+except ImportError:
+    orjson = None
 
 class Data(TypedDict):
     metadata: Dict[str, Any]
@@ -20,7 +35,183 @@ class Data(TypedDict):
     tables: List[Dict[str, Any]]
     captions: List[Dict[str, Any]]
 
-def format_results(conv: ConversionResult, data: Data, filename: str, image_path: str) -> bool:
+@dataclass
+class _FormatState:
+    ''' Mutable state shared by the item handlers of format_results '''
+    document: Any
+    filename: str
+    image_path: Any
+    pages_dict: Dict[int, Dict[str, Any]]
+    pages_append: Callable
+    tables_append: Callable
+    images_append: Callable
+    captions_append: Callable
+    page_parts: Dict[int, List[str]] = field(default_factory=dict)
+    caption_dict: Dict[str, str] = field(default_factory=dict)
+    counter: int = 0
+    image_saver: Callable | None = None
+    image_futures: List[Future] = field(default_factory=list)
+    image_encoding: tuple | None = None
+
+# Output formats for extracted pictures: (extension, Pillow format, save options),
+# all tuned for encoding speed. PNG stays the default since it is lossless
+IMAGE_FORMATS = {
+    'png': ('.png', 'PNG', {'optimize': False, 'compress_level': 1}),
+    'jpeg': ('.jpg', 'JPEG', {'quality': 85, 'optimize': False}),
+    'webp': ('.webp', 'WEBP', {'quality': 85, 'method': 0}),
+}
+# Modes JPEG can store; anything else (alpha, palette) is kept as PNG
+_JPEG_MODES = frozenset({'RGB', 'L', 'CMYK'})
+
+def _save_image(image, path, image_format: str, options: Dict[str, Any]) -> None:
+    ''' Encodes an extracted image, favoring speed over file size '''
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    # One write per image instead of one per chunk emitted by the encoder
+    with open(path, 'wb') as file:
+        file.write(buffer.getbuffer())
+
+def _add_to_page(state: _FormatState, page: int, content: str) -> None:
+    ''' Appends content to a page, creating it on first use '''
+    # Pieces are joined once at the end; += on a string held by a dict copies it every time
+    parts = state.page_parts.get(page)
+    if parts is None:
+        page_dict = state.pages_dict.get(page)
+        if page_dict is None:
+            page_dict = {'page_number': page, 'content': ""}
+            state.pages_append(page_dict)
+            state.pages_dict[page] = page_dict
+        parts = state.page_parts[page] = [page_dict['content']]
+    parts.append(content)
+
+# (prefix, suffix) wrapped around each text label in the page content,
+# looked up once per item instead of walking a chain of comparisons
+_PLAIN_TEXT = (" ", "")
+_TEXT_AFFIXES = {
+    DocItemLabel.TEXT: _PLAIN_TEXT,
+    DocItemLabel.SECTION_HEADER: ("\n# ", "\n"),
+    DocItemLabel.FORMULA: (" Equation: ", "\n"),
+    DocItemLabel.REFERENCE: ("\nReference: ", "\n"),
+    DocItemLabel.LIST_ITEM: ("\n- ", "\n"),
+    DocItemLabel.CAPTION: (" _", "_\n"),
+    DocItemLabel.FOOTNOTE: ("\nFootnote: ", "\n"),
+    DocItemLabel.TITLE: ("\n## ", "\n"),
+    DocItemLabel.PARAGRAPH: ("\n", "\n"),
+    DocItemLabel.PAGE_FOOTER: ("\n", "\n"),
+    DocItemLabel.CHECKBOX_SELECTED: ("\n- ", "\n"),
+    DocItemLabel.CHECKBOX_UNSELECTED: ("\n- ", "\n"),
+}
+
+def _format_text(item: TextItem, state: _FormatState) -> None:
+    page = item.prov[0].page_no
+    label = item.label
+    text = item.text
+
+    # Determina o conteúdo baseado no label
+    prefix, suffix = _TEXT_AFFIXES.get(label, _PLAIN_TEXT)
+    content = f"{prefix}{text}{suffix}"
+
+    if label == DocItemLabel.CAPTION:
+        # Armazena caption para uso posterior
+        state.captions_append({
+            'self_ref': item.self_ref,
+            'cref': item.parent.cref,
+            'text': text
+        })
+        # Também pré-processa para uso posterior
+        state.caption_dict[item.parent.cref] = text
+
+    # Adiciona o conteúdo à página
+    _add_to_page(state, page, content)
+
+def _format_table(item: TableItem, state: _FormatState) -> None:
+    table = item.export_to_markdown(doc=state.document)
+    self_ref = item.self_ref
+    page = item.prov[0].page_no
+
+    _add_to_page(state, page, f" <{self_ref}>")
+
+    state.tables_append({
+        'self_ref': self_ref,
+        'captions': item.captions,
+        'caption': "",
+        'references1': item.references,
+        'references': [],
+        'footnotes1': item.footnotes,
+        'footnotes': [],
+        'page': page,
+        'table': table
+    })
+
+# C-level key function, cheaper than a lambda called for every class
+_by_confidence = attrgetter('confidence')
+
+def _format_picture(item: PictureItem, state: _FormatState) -> None:
+    self_ref = item.self_ref
+    page = item.prov[0].page_no
+
+    # Extrair classificação, se disponível
+    classification = None
+    confidence = None
+    if item.annotations:
+        for annotation in item.annotations:
+            if annotation.kind == 'classification':
+                best_class = max(annotation.predicted_classes, key=_by_confidence)
+                classification = best_class.class_name
+                confidence = best_class.confidence
+                break
+
+    # Salva a imagem; a imagem é extraída aqui, mas a codificação
+    # acontece em outra thread enquanto o documento continua sendo percorrido
+    image = item.get_image(state.document)
+    if image is None:
+        # Imagens não geradas pelo conversor (generate_picture_images=False)
+        placeholder = None
+    else:
+        extension, image_format, options = state.image_encoding
+        if image_format == 'JPEG' and image.mode not in _JPEG_MODES:
+            extension, image_format, options = IMAGE_FORMATS['png']
+        placeholder = f"{state.filename}_{state.counter}{extension}"
+        image_filename = state.image_path / placeholder
+        state.image_futures.append(state.image_saver(_save_image, image, image_filename, image_format, options))
+        state.counter += 1
+
+        _add_to_page(state, page, f" <{placeholder}>")
+
+    state.images_append({
+        'ref': placeholder,
+        'self_ref': self_ref,
+        'captions': item.captions,
+        'caption': "",
+        'classification': classification,
+        'confidence': confidence,
+        'references1': item.references,
+        'references': [],
+        'footnotes1': item.footnotes,
+        'footnotes': [],
+        'page': page,
+    })
+
+# Docling items are concrete classes, so the handler is usually found by
+# type(item) alone; subclasses (e.g. SectionHeaderItem) are resolved once
+# through their MRO and cached
+_ITEM_HANDLERS: Dict[type, Callable | None] = {
+    TextItem: _format_text,
+    TableItem: _format_table,
+    PictureItem: _format_picture,
+}
+
+def _resolve_handler(item_type: type) -> Callable | None:
+    ''' Finds the handler of a docling item subclass and caches it '''
+    handler = None
+    for base in item_type.__mro__[1:]:
+        handler = _ITEM_HANDLERS.get(base)
+        if handler is not None:
+            break
+    _ITEM_HANDLERS[item_type] = handler
+    return handler
+
+def format_results(conv: ConversionResult, data: Data, filename: str, image_path: str, image_format: str = 'png') -> bool:
     ''' Uses the docling document to format a readable JSON result '''
     
     try:
@@ -30,139 +221,47 @@ def format_results(conv: ConversionResult, data: Data, filename: str, image_path
             pages_dict[page_dict['page_number']] = page_dict
             if 'content' not in page_dict:
                 page_dict['content'] = ""
-        
-        # Processa captions antecipadamente para uso posterior
-        caption_dict = {}
-        
-        counter = 0
-        for idx, (item, _) in enumerate(conv.document.iterate_items()):
-            if isinstance(item, TextItem):
-                page = item.prov[0].page_no
-                label = item.label
-                text = item.text
-                
-                # Criar ou obter a página uma única vez
-                if page not in pages_dict:
-                    new_page = {'page_number': page, 'content': ""}
-                    data['pages'].append(new_page)
-                    pages_dict[page] = new_page
-                
-                # Determina o conteúdo baseado no label
-                match label:
-                    case DocItemLabel.SECTION_HEADER:
-                        content = f"\n# {text}\n"
-                    case DocItemLabel.FORMULA:
-                        content = f" Equation: {text}\n"
-                    case DocItemLabel.REFERENCE:
-                        content = f"\nReference: {text}\n"
-                    case DocItemLabel.LIST_ITEM:
-                        content = f"\n- {text}\n"
-                    case DocItemLabel.CAPTION:
-                        content = f" _{text}_\n"
-                        # Armazena caption para uso posterior
-                        data['captions'].append({
-                            'self_ref': item.self_ref,
-                            'cref': item.parent.cref,
-                            'text': text
-                        })
-                        # Também pré-processa para uso posterior
-                        caption_dict[item.parent.cref] = text
-                    case DocItemLabel.FOOTNOTE:
-                        content = f"\nFootnote: {text}\n"
-                    case DocItemLabel.TITLE:
-                        content = f"\n## {text}\n"
-                    case DocItemLabel.TEXT:
-                        content = f" {text}"
-                    case DocItemLabel.PARAGRAPH:
-                        content = f"\n{text}\n"
-                    case DocItemLabel.PAGE_FOOTER:
-                        content = f"\n{text}\n"
-                    case DocItemLabel.CHECKBOX_SELECTED:
-                        content = f"\n- {text}\n"
-                    case DocItemLabel.CHECKBOX_UNSELECTED:
-                        content = f"\n- {text}\n"
-                    case _:
-                        content = f" {text}"
-                
-                # Adiciona o conteúdo à página
-                pages_dict[page]['content'] += content
-                    
-            elif isinstance(item, TableItem):
-                table = item.export_to_markdown(doc=conv.document)
-                self_ref = item.self_ref
-                page = item.prov[0].page_no
-                
-                # Criar ou obter a página uma única vez
-                if page not in pages_dict:
-                    new_page = {'page_number': page, 'content': f" <{self_ref}>"}
-                    data['pages'].append(new_page)
-                    pages_dict[page] = new_page
-                else:
-                    pages_dict[page]['content'] += f" <{self_ref}>"
-                
-                data['tables'].append({
-                    'self_ref': self_ref,
-                    'captions': item.captions,
-                    'caption': "",
-                    'references': item.references,
-                    'footnotes': item.footnotes,
-                    'page': page,
-                    'table': table
-                })
-    
-            elif isinstance(item, PictureItem):
-                self_ref = item.self_ref
-                page = item.prov[0].page_no
-                
-                # Extrair classificação, se disponível
-                classification = None
-                confidence = None
-                if item.annotations:
-                    for annotation in item.annotations:
-                        if annotation.kind == 'classification':
-                            best_class = max(
-                                annotation.predicted_classes,
-                                key=lambda cls: cls.confidence
-                            )
-                            classification = best_class.class_name
-                            confidence = best_class.confidence
-                            break
-                
-                # Salva a imagem
-                image_filename = (image_path / f"{filename}_{counter}.png")
-                placeholder = f"{filename}_{counter}.png"
-                with image_filename.open('wb') as file:
-                    item.get_image(conv.document).save(file, "PNG")
-                
-                # Criar ou obter a página uma única vez
-                if page not in pages_dict:
-                    new_page = {'page_number': page, 'content': f" <{placeholder}>"}
-                    data['pages'].append(new_page)
-                    pages_dict[page] = new_page
+
+        # Evita resolver os mesmos atributos a cada item do documento
+        state = _FormatState(
+            document=conv.document,
+            filename=filename,
+            image_path=image_path,
+            pages_dict=pages_dict,
+            pages_append=data['pages'].append,
+            tables_append=data['tables'].append,
+            images_append=data['images'].append,
+            captions_append=data['captions'].append,
+            image_encoding=IMAGE_FORMATS[image_format],
+        )
+        handlers = _ITEM_HANDLERS
+
+        with ThreadPoolExecutor(max_workers=4) as png_pool:
+            state.image_saver = png_pool.submit
+            for item, _ in conv.document.iterate_items():
+                item_type = type(item)
+                if item_type in handlers:
+                    handler = handlers[item_type]
                 else:
-                    pages_dict[page]['content'] += f" <{placeholder}>"
-                
-                data['images'].append({
-                    'ref': placeholder,
-                    'self_ref': self_ref,
-                    'captions': item.captions,
-                    'caption': "",
-                    'classification': classification,
-                    'confidence': confidence,
-                    'references1': item.references,
-                    'references': [],
-                    'footnotes1': item.footnotes,
-                    'footnotes': [],
-                    'page': page,
-                })
-                counter += 1
-
-        # Processa as referências de texto e aplica captions
-        text_refs = {}
-        for text in conv.document.texts:
-            if text.label == DocItemLabel.TEXT:
-                text_refs[text.self_ref] = text.text
-        
+                    handler = _resolve_handler(item_type)
+                if handler is not None:
+                    handler(item, state)
+
+            # Espera as imagens e propaga qualquer erro de gravação
+            for future in state.image_futures:
+                future.result()
+
+        # Monta o conteúdo de cada página de uma só vez
+        for page, parts in state.page_parts.items():
+            pages_dict[page]['content'] = "".join(parts)
+
+        caption_dict = state.caption_dict
+
+        # Textos simples de todo o documento (inclusive dentro de figuras e
+        # furniture) para resolver referências e notas de rodapé
+        text_refs = {text.self_ref: text.text for text in conv.document.texts
+                     if text.label == DocItemLabel.TEXT}
+
         # Aplica captions, referências e notas de rodapé em uma única iteração
         for image in data.get("images", []):
             # Aplica caption
@@ -172,15 +271,15 @@ def format_results(conv: ConversionResult, data: Data, filename: str, image_path
             
             # Aplica referências
             for ref in image.get("references1", []):
-                ref_key = getattr(ref, 'self_ref', str(ref))
+                ref_key = getattr(ref, 'cref', str(ref))
                 if ref_key in text_refs:
-                    image['references'].append(text_refs[ref])
+                    image['references'].append(text_refs[ref_key])
             
             # Aplica notas de rodapé
             for footnote in image.get("footnotes1", []):
-                footnote_key = getattr(footnote, 'self_ref', str(footnote))
+                footnote_key = getattr(footnote, 'cref', str(footnote))
                 if footnote_key in text_refs:
-                    image['footnotes'].append(text_refs[footnote])
+                    image['footnotes'].append(text_refs[footnote_key])
             
             # Remove campos temporários
             image.pop('captions')
@@ -195,41 +294,68 @@ def format_results(conv: ConversionResult, data: Data, filename: str, image_path
                 table["caption"] += caption_dict[self_ref]
             
             # Aplica referências
-            for ref in table.get("references", []):
-                ref_key = getattr(ref, 'self_ref', str(ref))
+            for ref in table.get("references1", []):
+                ref_key = getattr(ref, 'cref', str(ref))
                 if ref_key in text_refs:
-                    table['references'].append(text_refs[ref])
+                    table['references'].append(text_refs[ref_key])
             
             # Aplica notas de rodapé
-            for footnote in table.get("footnotes", []):
-                footnote_key = getattr(footnote, 'self_ref', str(footnote))
+            for footnote in table.get("footnotes1", []):
+                footnote_key = getattr(footnote, 'cref', str(footnote))
                 if footnote_key in text_refs:
-                    table['footnotes'].append(text_refs[footnote])
+                    table['footnotes'].append(text_refs[footnote_key])
             
             # Remove campos temporários
             table.pop('captions')
-            if 'references1' in table:
-                table.pop('references1')
-            if 'footnotes1' in table:
-                table.pop('footnotes1')
+            table.pop('references1')
+            table.pop('footnotes1')
 
         # Remove captions temporárias
         data.pop('captions')
         
         return True
     except Exception as e:
-        print(f"\033[33mError formatting result: {e}\033[0m")
-        traceback.print_exc()
+        logger.error(f"Error formatting result: {e}\n{traceback.format_exc()}")
         return False
 
-def get_safe_executor(max_workers=None):
+def write_json(path: str | os.PathLike, obj: Any, default: Callable | None = None, atomic: bool = False) -> None:
+    ''' Writes obj as indented UTF-8 JSON, using orjson when it is installed '''
+    if orjson is not None:
+        data = orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        # Encoded up front and written once, rather than json.dump's many small writes
+        data = json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+
+    # atomic: readers see either the previous file or the new one, never a partial write
+    if not atomic:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return
+
+    target = f"{os.fspath(path)}.tmp"
     try:
-        multiprocessing.set_start_method('spawn', force=True)
-    except RuntimeError:
-        # Method might already be set
-        pass
-        
-    return ProcessPoolExecutor(max_workers=max_workers)
+        with open(target, 'wb') as f:
+            f.write(data)
+        os.replace(target, path)
+    except OSError:
+        # e.g. Windows refuses the replace while a reader holds the file open
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        raise
+
+# Start method for every worker process, passed explicitly instead of
+# forcing the global one. Plain fork is unsafe once torch/CUDA are loaded;
+# on Linux a forkserver imports docling and torch once and forks cheap
+# workers from it (see process_batch), elsewhere each worker is spawned
+if sys.platform.startswith('linux'):
+    MP_CONTEXT = multiprocessing.get_context('forkserver')
+else:
+    MP_CONTEXT = multiprocessing.get_context('spawn')
+
+def get_safe_executor(max_workers=None):
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=MP_CONTEXT)
 
 class ColorfulFormatter(logging.Formatter):
     COLOURS = {
@@ -241,13 +367,37 @@ class ColorfulFormatter(logging.Formatter):
     }
     RESET = '\033[0m'  # Reset to default color
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Bound once instead of resolved on every record
+        self._get_colour = self.COLOURS.get
+        self._reset = self.RESET
+
     def format(self, record):
-        log_color = self.COLOURS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
+        reset = self._reset
+        log_color = self._get_colour(record.levelname, reset)
+        record.levelname = f"{log_color}{record.levelname}{reset}"
    
         return super().format(record)
 
+# Listener threads started by setup_logging, flushed and stopped at exit
+_log_listeners: List[QueueListener] = []
+
+def _stop_log_listeners() -> None:
+    for listener in _log_listeners:
+        listener.stop()
+    _log_listeners.clear()
+
+atexit.register(_stop_log_listeners)
+
 def setup_logging(level=logging.INFO):
+    pdfplucker_logger = logging.getLogger('pdfplucker')
+
+    # Already configured in this process (worker processes call it too)
+    if _log_listeners:
+        pdfplucker_logger.setLevel(level)
+        return pdfplucker_logger
+
     # Create formatters
     detailed_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     simple_formatter = ColorfulFormatter('%(asctime)s - %(levelname)s - %(message)s')
@@ -256,7 +406,8 @@ def setup_logging(level=logging.INFO):
     log_dir = os.path.join(os.getcwd(), 'logs')
     os.makedirs(log_dir, exist_ok=True)
     
-    pdfplucker_file = logging.FileHandler(os.path.join(log_dir, 'pdfplucker.log'))
+    # delay=True only opens the files when the first record arrives
+    pdfplucker_file = logging.FileHandler(os.path.join(log_dir, 'pdfplucker.log'), delay=True)
     pdfplucker_file.setFormatter(detailed_formatter)
     
     # Create console handler
@@ -264,7 +415,7 @@ def setup_logging(level=logging.INFO):
     console.setFormatter(simple_formatter)
     
     # Create a third-party log file for docling
-    third_party_file = logging.FileHandler(os.path.join(log_dir, 'dependencies.log'))
+    third_party_file = logging.FileHandler(os.path.join(log_dir, 'dependencies.log'), delay=True)
     third_party_file.setFormatter(detailed_formatter)
     third_party_file.setLevel(logging.DEBUG)  # All levels
     
@@ -273,25 +424,74 @@ def setup_logging(level=logging.INFO):
     root_logger.setLevel(logging.DEBUG)  # All levels
     
     # Remove any existing handlers to avoid duplicates
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    root_logger.handlers.clear()
     
-    root_logger.addHandler(third_party_file)
+    # The loggers only enqueue records; listener threads own the real handlers,
+    # so logging calls never block on file or console writes
+    third_party_queue = queue.SimpleQueue()
+    _log_listeners.append(QueueListener(third_party_queue, third_party_file, respect_handler_level=True))
+    root_logger.addHandler(QueueHandler(third_party_queue))
     
     # Configure your package's logger
-    pdfplucker_logger = logging.getLogger('pdfplucker')
     pdfplucker_logger.setLevel(level)
     
     # Remove any existing handlers to avoid duplicates
-    for handler in pdfplucker_logger.handlers[:]:
-        pdfplucker_logger.removeHandler(handler)
+    pdfplucker_logger.handlers.clear()
     
-    pdfplucker_logger.addHandler(pdfplucker_file)
-    pdfplucker_logger.addHandler(console)
+    pdfplucker_queue = queue.SimpleQueue()
+    _log_listeners.append(QueueListener(pdfplucker_queue, pdfplucker_file, console, respect_handler_level=True))
+    pdfplucker_logger.addHandler(QueueHandler(pdfplucker_queue))
+
+    for listener in _log_listeners:
+        listener.start()
     
     # Make sure your logger doesn't propagate to root
     pdfplucker_logger.propagate = False
-    
+
     return pdfplucker_logger
 
-logger = setup_logging()
+class _PipeHandler(QueueHandler):
+    ''' Sends records through the write end of a Pipe, one whole record at a time '''
+    def __init__(self, conn):
+        super().__init__(conn)
+        self._send_lock = threading.Lock()
+
+    def enqueue(self, record):
+        with self._send_lock:
+            self.queue.send(record)
+
+def setup_worker_logging(log_conn, level=logging.INFO):
+    ''' Sends every record of a worker process to the parent instead of writing it here '''
+    # A Pipe per worker rather than a shared Queue: a worker killed on timeout
+    # can't leave a lock held that every other process needs to log
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.handlers.clear()
+    root_logger.addHandler(_PipeHandler(log_conn))
+
+    pdfplucker_logger = logging.getLogger('pdfplucker')
+    pdfplucker_logger.setLevel(level)
+    pdfplucker_logger.handlers.clear()
+    pdfplucker_logger.propagate = True
+
+    return pdfplucker_logger
+
+def _forward_records(log_conn) -> None:
+    while True:
+        try:
+            record = log_conn.recv()
+        except Exception:
+            # EOF once the worker exits; a worker killed mid-send can also
+            # leave a truncated record that fails to unpickle
+            break
+        logging.getLogger(record.name).handle(record)
+    log_conn.close()
+
+def forward_worker_logs(log_conn) -> threading.Thread:
+    ''' Hands the records a worker sends to this process' handlers until its end of the pipe closes '''
+    thread = threading.Thread(target=_forward_records, args=(log_conn,), name='pdfplucker-worker-logs', daemon=True)
+    thread.start()
+    return thread
+
+# Handlers are attached by setup_logging, called once by each entry point
+logger = logging.getLogger('pdfplucker')